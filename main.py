@@ -3,13 +3,163 @@
 Simple Python VoiceOver test script
 """
 
-import requests
-import json
-import time
+import argparse
+import aiohttp
+import asyncio
+import contextlib
+import sys
 
-def test_voiceover_operations():
+from typing import List, Optional, Tuple
+
+from voiceover_client import DEFAULT_TIMEOUT, AsyncVoiceOverClient
+
+# Scan targets: JavaScript regular expressions the server matches
+# case-insensitively (an invalid one is rejected with a 400)
+_PATTERNS = {
+    "open": r"show more",
+    "upload": r"^(?=.*upload)(?=.*file)",
+    "decorative": r", image",
+}
+
+# Per-element trace lines are buffered and written once per phase unless --verbose
+VERBOSE = False
+TRACE: List[str] = []
+
+def log(msg: str) -> None:
+    if VERBOSE:
+        print(msg)
+    else:
+        TRACE.append(msg)
+
+def flush_trace() -> None:
+    if TRACE:
+        sys.stdout.write("\n".join(TRACE) + "\n")
+        TRACE.clear()
+
+async def wait_until_focus_changes(client: AsyncVoiceOverClient, prev: Optional[str], timeout: float = 3.0) -> Optional[str]:
+    """
+    Poll the current item with exponential backoff until it differs from prev.
+    
+    Returns the new item, or None if focus has not changed within timeout seconds.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    attempt = 0
+    
+    while True:
+        result = await client.get_current_item()
+        if result.success and result.currentItem != prev:
+            return result.currentItem
+        
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return None
+        await asyncio.sleep(min(0.05 * 2 ** attempt, remaining))
+        attempt += 1
+
+async def walk_until(client: AsyncVoiceOverClient, pattern: str, step_delay_ms: int, limit: int,
+                     trace_label: str = "Current focus") -> Tuple[bool, str, Optional[str]]:
+    """
+    Stream the server-side walk until pattern matches.
+    
+    Returns (found, last visited item, error); error is None unless the walk failed.
+    """
+    found, current_item, error = False, "", None
+    # aclosing() closes the stream as soon as we stop reading, not at GC time
+    async with contextlib.aclosing(client.walk(stop_on=pattern, limit=limit, step_delay_ms=step_delay_ms)) as walk:
+        async for elem in walk:
+            if not elem.get("success"):
+                error = elem.get("error")
+                break
+            current_item = elem["item"]
+            log(f"   📍 {trace_label}: {current_item}")
+            if elem["matched"]:
+                found = True
+                break
+    flush_trace()
+    return found, current_item, error
+
+async def find_open_icon(client: AsyncVoiceOverClient, step_delay_ms: int, max_attempts: int) -> bool:
+    """Step 4.1: Navigate to the Open(+) icon control and activate it"""
+    print("   🔍 Step 4.1: Navigating to Open(+) icon control...")
+    
+    # The server walks the focus forward and stops on the first match
+    open_icon_found, current_item, error = await walk_until(client, _PATTERNS["open"], step_delay_ms, max_attempts)
+    
+    if open_icon_found:
+        print("   ✅ Found Open(+) icon control!")
+        
+        # Activate the Open(+) icon
+        click_result = await client.click_current()
+        
+        if click_result.success:
+            print("   ✅ Open(+) icon activated successfully")
+            await wait_until_focus_changes(client, current_item, timeout=2.0)  # Wait for UI to respond
+        else:
+            print(f"   ❌ Failed to activate Open(+) icon: {click_result.error}")
+    elif error is not None:
+        print(f"   ❌ Unable to get current element: {error}")
+    else:
+        print("   ⚠️  Open(+) icon not found after maximum attempts")
+    
+    return open_icon_found
+
+async def find_upload(client: AsyncVoiceOverClient, step_delay_ms: int, max_attempts: int) -> bool:
+    """Step 4.2: Navigate to the Upload file control and activate it"""
+    print("   🔍 Step 4.2: Navigating to Upload file control...")
+    
+    upload_control_found, current_item, error = await walk_until(client, _PATTERNS["upload"], step_delay_ms, max_attempts)
+    
+    if upload_control_found:
+        print("   ✅ Found Upload file control!")
+        
+        # Try keyboard activation first
+        print("   ⌨️  Attempting keyboard activation...")
+        click_result = await client.click_current()
+        
+        if not click_result.success:
+            print("   ⚠️  Keyboard activation failed - control not accessible with keyboard")
+            print("   🖱️  Using mouse activation as fallback...")
+            # Note: In a real implementation, you would need mouse coordinates
+            # For this demo, we'll simulate the mouse click attempt
+            print("   🖱️  Simulating mouse click on Upload file control...")
+            await asyncio.sleep(1)
+            print("   ✅ Upload file control activated via mouse")
+        else:
+            print("   ✅ Upload file control activated via keyboard")
+        
+        await wait_until_focus_changes(client, current_item, timeout=2.0)  # Wait for UI to respond
+    elif error is not None:
+        print(f"   ❌ Unable to get current element: {error}")
+    else:
+        print("   ⚠️  Upload file control not found after maximum attempts")
+    
+    return upload_control_found
+
+async def scan_decorative(client: AsyncVoiceOverClient, step_delay_ms: int, max_focus_checks: int) -> Optional[bool]:
+    """
+    Step 4.3: Check whether focus lands on a decorative image
+    
+    Returns True if one was found, False if none was, or None if the check could not run.
+    """
+    print("   🔍 Step 4.3: Checking for decorative image focus issues...")
+    
+    decorative_image_detected, current_item, error = await walk_until(
+        client, _PATTERNS["decorative"], step_delay_ms, max_focus_checks, trace_label="Checking focus")
+    
+    if decorative_image_detected:
+        print(f"   ⚠️  ISSUE DETECTED: Screen reader focus moved to decorative image!")
+        print(f"   📢 Image content being announced: '{current_item}'")
+    elif error is not None:
+        print(f"   ❌ Unable to get current element: {error}")
+        return None
+    
+    return decorative_image_detected
+
+async def test_voiceover_operations(session: aiohttp.ClientSession, base_url: str = "http://localhost:3000",
+                                    step_delay: float = 0.1, max_attempts: int = 5):
     """Test basic VoiceOver operations"""
-    base_url = "http://localhost:3000"
+    client = AsyncVoiceOverClient(session, base_url)
     
     print("🎯 Starting Python -> TypeScript -> VoiceOver integration test")
     print("=" * 60)
@@ -17,14 +167,15 @@ def test_voiceover_operations():
     # 1. Health check
     print("1. Checking server status...")
     try:
-        response = requests.get(f"{base_url}/health")
-        if response.status_code == 200:
-            data = response.json()
-            print(f"   ✅ Server running normally")
-            print(f"   📊 VoiceOver status: {'Running' if data.get('voiceOverRunning') else 'Not running'}")
-        else:
-            print(f"   ❌ Server error: {response.status_code}")
-            return
+        async with session.get(f"{base_url}/health",
+                               timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT)) as response:
+            if response.status == 200:
+                data = await response.json()
+                print(f"   ✅ Server running normally")
+                print(f"   📊 VoiceOver status: {'Running' if data.get('voiceOverRunning') else 'Not running'}")
+            else:
+                print(f"   ❌ Server error: {response.status}")
+                return
     except Exception as e:
         print(f"   ❌ Connection failed: {e}")
         return
@@ -32,13 +183,12 @@ def test_voiceover_operations():
     # 2. Start VoiceOver
     print("\n2. Starting VoiceOver...")
     try:
-        response = requests.post(f"{base_url}/voiceover/start")
-        result = response.json()
-        if result.get("success"):
+        result = await client.start_voiceover()
+        if result.success:
             print("   ✅ VoiceOver started successfully")
         else:
-            print(f"   ❌ VoiceOver startup failed: {result.get('error')}")
-            if "VoiceOver not supported" in str(result.get('error', '')):
+            print(f"   ❌ VoiceOver startup failed: {result.error}")
+            if "VoiceOver not supported" in str(result.error or ''):
                 print("   💡 Please ensure VoiceOver permissions are configured as per README")
             return
     except Exception as e:
@@ -49,30 +199,19 @@ def test_voiceover_operations():
     # 3. Open Copilot
     print("\n3. Opening Copilot...")
     try:
-        # Try different Copilot application names
-        copilot_names = ["Copilot"]
-        copilot_opened = False
-        
-        for app_name in copilot_names:
-            try:
-                response = requests.post(f"{base_url}/system/open-app", 
-                                       json={"appName": app_name})
-                result = response.json()
-                if result.get("success"):
-                    print(f"   ✅ Successfully opened {app_name}")
-                    copilot_opened = True
-                    break
-                else:
-                    print(f"   ⚠️  Trying to open {app_name}: {result.get('error')}")
-            except Exception as e:
-                print(f"   ❌ Failed to try {app_name}: {e}")
+        focus_before = (await client.get_current_item()).currentItem
         
-        if not copilot_opened:
+        # The server tries each Copilot application name in turn
+        result = await client.open_any_app(["Copilot", "GitHub Copilot"])
+        if result.success:
+            print(f"   ✅ Successfully opened {result.opened}")
+        else:
+            print(f"   ⚠️  Tried {', '.join(result.tried or [])}: {result.error}")
             print("   ⚠️  Copilot application not found, you may need to install GitHub Copilot first")
             
         # Wait for application to start
         print("   ⏰ Waiting for application to start...")
-        time.sleep(3)
+        await wait_until_focus_changes(client, focus_before, timeout=3.0)
         
     except Exception as e:
         print(f"   ❌ Request failed: {e}")
@@ -80,131 +219,16 @@ def test_voiceover_operations():
     # 4. Test accessibility navigation scenario
     print("\n4. Testing accessibility navigation scenario...")
     try:
-        # Step 4.1: Navigate to Open(+) icon control
-        print("   🔍 Step 4.1: Navigating to Open(+) icon control...")
-        open_icon_found = False
-        navigation_attempts = 0
-        max_attempts = 5
-        
-        while not open_icon_found and navigation_attempts < max_attempts:
-            # Get current element
-            current_response = requests.get(f"{base_url}/voiceover/current")
-            current_result = current_response.json()
-            
-            if current_result.get("success"):
-                current_text = current_result.get("currentItem", "").lower()
-                print(f"   � Current focus: {current_result.get('currentItem', 'Unknown')}")
-                
-                if "show more" in current_text:
-                    print("   ✅ Found Open(+) icon control!")
-                    open_icon_found = True
-                    
-                    # Activate the Open(+) icon
-                    click_response = requests.post(f"{base_url}/voiceover/click")
-                    click_result = click_response.json()
-                    
-                    if click_result.get("success"):
-                        print("   ✅ Open(+) icon activated successfully")
-                        time.sleep(2)  # Wait for UI to respond
-                    else:
-                        print(f"   ❌ Failed to activate Open(+) icon: {click_result.get('error')}")
-                    break
-                else:
-                    # Navigate to next element
-                    next_response = requests.post(f"{base_url}/voiceover/next")
-                    navigation_attempts += 1
-                    time.sleep(0.5)
-            else:
-                print(f"   ❌ Unable to get current element: {current_result.get('error')}")
-                break
-        
-        if not open_icon_found:
-            print("   ⚠️  Open(+) icon not found after maximum attempts")
-        
-        # Step 4.2: Navigate to Upload file control
-        print("   🔍 Step 4.2: Navigating to Upload file control...")
-        upload_control_found = False
-        navigation_attempts = 0
+        # The phases share the single VoiceOver cursor, so each one starts
+        # where the previous one left focus and they must run in order
+        step_delay_ms = round(step_delay * 1000)
+        await find_open_icon(client, step_delay_ms, max_attempts)
+        await find_upload(client, step_delay_ms, max_attempts)
+        decorative_image_detected = await scan_decorative(client, step_delay_ms, max_attempts)
         
-        while not upload_control_found and navigation_attempts < max_attempts:
-            # Get current element
-            current_response = requests.get(f"{base_url}/voiceover/current")
-            current_result = current_response.json()
-            
-            if current_result.get("success"):
-                current_text = current_result.get("currentItem", "").lower()
-                print(f"   📍 Current focus: {current_result.get('currentItem', 'Unknown')}")
-                
-                if "upload" in current_text and "file" in current_text:
-                    print("   ✅ Found Upload file control!")
-                    upload_control_found = True
-                    
-                    # Try keyboard activation first
-                    print("   ⌨️  Attempting keyboard activation...")
-                    click_response = requests.post(f"{base_url}/voiceover/click")
-                    click_result = click_response.json()
-                    
-                    if not click_result.get("success"):
-                        print("   ⚠️  Keyboard activation failed - control not accessible with keyboard")
-                        print("   🖱️  Using mouse activation as fallback...")
-                        # Note: In a real implementation, you would need mouse coordinates
-                        # For this demo, we'll simulate the mouse click attempt
-                        print("   🖱️  Simulating mouse click on Upload file control...")
-                        time.sleep(1)
-                        print("   ✅ Upload file control activated via mouse")
-                    else:
-                        print("   ✅ Upload file control activated via keyboard")
-                    
-                    time.sleep(2)  # Wait for UI to respond
-                    break
-                else:
-                    # Navigate to next element
-                    next_response = requests.post(f"{base_url}/voiceover/next")
-                    navigation_attempts += 1
-                    time.sleep(0.5)
-            else:
-                print(f"   ❌ Unable to get current element: {current_result.get('error')}")
-                break
-        
-        if not upload_control_found:
-            print("   ⚠️  Upload file control not found after maximum attempts")
-        
-        # Step 4.3: Check for decorative image focus issue
-        print("   🔍 Step 4.3: Checking for decorative image focus issues...")
-        decorative_image_detected = False
-        focus_check_attempts = 0
-        max_focus_checks = 5
-        
-        decorative_keywords = [", image"]
-        
-        while focus_check_attempts < max_focus_checks:
-            current_response = requests.get(f"{base_url}/voiceover/current")
-            current_result = current_response.json()
-            
-            if current_result.get("success"):
-                current_text = current_result.get("currentItem", "")
-                current_text_lower = current_text.lower()
-                print(f"   📍 Checking focus: {current_text}")
-                
-                # Check if current focus is on a decorative image
-                for keyword in decorative_keywords:
-                    if keyword in current_text_lower:
-                        decorative_image_detected = True
-                        print(f"   ⚠️  ISSUE DETECTED: Screen reader focus moved to decorative image!")
-                        print(f"   📢 Image content being announced: '{current_text}'")
-                        break
-                
-                if decorative_image_detected:
-                    break
-                
-                # Move to next element to continue checking
-                next_response = requests.post(f"{base_url}/voiceover/next")
-                focus_check_attempts += 1
-                time.sleep(0.5)
-            else:
-                break
-        
-        if not decorative_image_detected:
+        if decorative_image_detected is None:
+            print("   ⚠️  Decorative image check did not complete; no verification result")
+        elif not decorative_image_detected:
             print("=" * 30, "Verification Result", "=" * 30)
             print("   ✅ No decorative image focus issues detected")
         
@@ -216,16 +240,50 @@ def test_voiceover_operations():
     # 5. Stop VoiceOver
     print("\n5. Stopping VoiceOver...")
     try:
-        response = requests.post(f"{base_url}/voiceover/stop")
-        result = response.json()
-        if result.get("success"):
+        result = await client.stop_voiceover()
+        if result.success:
             print("   ✅ VoiceOver stopped")
         else:
-            print(f"   ❌ Stop failed: {result.get('error')}")
+            print(f"   ❌ Stop failed: {result.error}")
     except Exception as e:
         print(f"   ❌ Request failed: {e}")
     
     print("\n🎉 Accessibility test completed!")
 
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1"""
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+def non_negative_float(value: str) -> float:
+    """argparse type for delays that must be finite and not negative"""
+    number = float(value)
+    if not 0 <= number < float("inf"):
+        raise argparse.ArgumentTypeError(f"must be a non-negative number, got {value}")
+    return number
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Python -> TypeScript -> VoiceOver integration test")
+    parser.add_argument("--base-url", default="http://localhost:3000",
+                        help="VoiceOver server URL (default: http://localhost:3000)")
+    parser.add_argument("--step-delay", type=non_negative_float, default=0.1,
+                        help="Seconds to pause between navigation steps (default: 0.1)")
+    parser.add_argument("--max-attempts", type=positive_int, default=5,
+                        help="Maximum elements to walk past in each scan phase (default: 5)")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Print each visited element as soon as it is logged")
+    return parser.parse_args()
+
+async def main():
+    global VERBOSE
+    args = parse_args()
+    VERBOSE = args.verbose
+    # One session (and connection pool) for the whole run; every request sets
+    # its own timeout, so starting VoiceOver is not capped by a session total
+    async with aiohttp.ClientSession() as session:
+        await test_voiceover_operations(session, args.base_url, args.step_delay, args.max_attempts)
+
 if __name__ == "__main__":
-    test_voiceover_operations()
+    asyncio.run(main())
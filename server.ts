@@ -1,11 +1,12 @@
 import express, { Request, Response } from 'express';
 import { voiceOver } from "@guidepup/guidepup";
-import { exec } from "child_process";
+import { exec, execFile } from "child_process";
 import { promisify } from "util";
 
 const app = express();
 const port = 3000;
 const execAsync = promisify(exec);
+const execFileAsync = promisify(execFile);
 
 app.use(express.json());
 
@@ -51,7 +52,8 @@ app.post('/voiceover/type', async (req: Request, res: Response) => {
   }
 });
 
-// Navigate next
+// Navigate next. The reply carries the newly focused item, so callers do not
+// need a separate GET /voiceover/current after moving.
 app.post('/voiceover/next', async (req: Request, res: Response) => {
   try {
     await voiceOver.next();
@@ -72,6 +74,50 @@ app.get('/voiceover/current', async (req: Request, res: Response) => {
   }
 });
 
+// Walk forward, streaming one NDJSON line {success, item, matched, step} per
+// visited element until `stop_on` (a case-insensitive regular expression)
+// matches or `limit` elements have been checked.
+app.get('/voiceover/walk', async (req: Request, res: Response) => {
+  const stopOn = req.query.stop_on;
+  const limit = Number(req.query.limit ?? 20);
+  const stepDelayMs = Number(req.query.step_delay_ms ?? 500);
+  if (typeof stopOn !== 'string' || stopOn === '') {
+    return res.status(400).json({ success: false, error: 'stop_on pattern is required' });
+  }
+  if (!Number.isInteger(limit) || limit < 1) {
+    return res.status(400).json({ success: false, error: 'limit must be a positive integer' });
+  }
+  if (!Number.isFinite(stepDelayMs) || stepDelayMs < 0) {
+    return res.status(400).json({ success: false, error: 'step_delay_ms must be a non-negative number' });
+  }
+  let regex: RegExp;
+  try {
+    regex = new RegExp(stopOn, 'i');
+  } catch (error: any) {
+    return res.status(400).json({ success: false, error: `Invalid stop_on pattern: ${error.message}` });
+  }
+
+  let closed = false;
+  res.on('close', () => { closed = true; });
+  res.setHeader('Content-Type', 'application/x-ndjson');
+
+  try {
+    for (let step = 0; step < limit && !closed; step++) {
+      const item = await voiceOver.lastSpokenPhrase();
+      const matched = regex.test(item);
+      res.write(JSON.stringify({ success: true, item, matched, step }) + '\n');
+      if (matched) {
+        break;
+      }
+      await voiceOver.next();
+      await new Promise((resolve) => setTimeout(resolve, stepDelayMs));
+    }
+  } catch (error: any) {
+    res.write(JSON.stringify({ success: false, error: error.message }) + '\n');
+  }
+  res.end();
+});
+
 // Click current item
 app.post('/voiceover/click', async (req: Request, res: Response) => {
   try {
@@ -96,18 +142,31 @@ app.post('/voiceover/press', async (req: Request, res: Response) => {
   }
 });
 
-// Open application
+// Open application. Either a single `appName` or a list of `candidates`,
+// which are tried in order until one opens.
 app.post('/system/open-app', async (req: Request, res: Response) => {
-  try {
-    const { appName } = req.body;
-    if (!appName) {
-      return res.status(400).json({ success: false, error: 'App name is required' });
+  const { appName, candidates } = req.body;
+  const names: unknown[] = Array.isArray(candidates) && candidates.length > 0 ? candidates : appName ? [appName] : [];
+  if (names.length === 0) {
+    return res.status(400).json({ success: false, error: 'App name is required' });
+  }
+  if (!names.every((name) => typeof name === 'string' && name !== '')) {
+    return res.status(400).json({ success: false, error: 'App names must be non-empty strings' });
+  }
+
+  const tried: string[] = [];
+  let lastError = '';
+  for (const name of names as string[]) {
+    tried.push(name);
+    try {
+      // execFile passes the name as a single argument, with no shell to interpret it
+      await execFileAsync('open', ['-a', name]);
+      return res.json({ success: true, message: `Opened ${name}`, opened: name, tried });
+    } catch (error: any) {
+      lastError = error.message;
     }
-    await execAsync(`open -a "${appName}"`);
-    res.json({ success: true, message: `Opened ${appName}` });
-  } catch (error: any) {
-    res.status(500).json({ success: false, error: error.message });
   }
+  res.status(500).json({ success: false, error: lastError, opened: null, tried });
 });
 
 // Press key
@@ -154,6 +213,7 @@ app.listen(port, () => {
   console.log('  POST /voiceover/type     - Type text');
   console.log('  POST /voiceover/next     - Navigate next');
   console.log('  GET  /voiceover/current  - Get current item');
+  console.log('  GET  /voiceover/walk     - Stream visited items until one matches');
   console.log('  POST /voiceover/click    - Click current item');
   console.log('  POST /voiceover/press    - Press key with VoiceOver');
   console.log('  POST /system/open-app    - Open application');
@@ -1,43 +1,100 @@
+import sys
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ReadTimeoutError
+import asyncio
 import time
-from typing import Optional, List, Dict, Any
-from dataclasses import dataclass
+from typing import Optional, List, Dict, Any, AsyncIterator, Iterator, Sequence
+from dataclasses import dataclass, fields
+try:
+    from orjson import loads as _loads
+except ImportError:  # orjson is optional; fall back to the stdlib decoder
+    from json import loads as _loads
+try:
+    import aiohttp
+except ImportError:  # aiohttp is only needed by AsyncVoiceOverClient
+    aiohttp = None
 
-@dataclass
+# __slots__ keeps instances small; dataclass only supports it from Python 3.10.
+# Frozen because get_current_item() hands the same cached instance to every caller
+@dataclass(frozen=True, **({"slots": True} if sys.version_info >= (3, 10) else {}))
 class VoiceOverResponse:
     success: bool
     message: Optional[str] = None
     currentItem: Optional[str] = None
     responses: Optional[List[str]] = None
     error: Optional[str] = None
+    opened: Optional[str] = None
+    tried: Optional[List[str]] = None
+
+# Seconds to wait for the server before giving up on a request
+DEFAULT_TIMEOUT = 5.0
+# Starting or stopping VoiceOver rewrites its settings and then waits up to
+# 10 s for it to come up or go away, so those calls (and the combined Copilot
+# operation, which runs for as long as the conversation takes) get a longer limit
+LONG_TIMEOUT = 30.0
+
+# Optional VoiceOverResponse fields that may be copied from a server reply
+_RESP_FIELDS = frozenset(f.name for f in fields(VoiceOverResponse)) - {"success"}
+
+def _to_response(result: Dict[str, Any]) -> VoiceOverResponse:
+    """Build a VoiceOverResponse from a decoded server reply"""
+    # Only copy the keys the reply actually has; unknown keys are ignored
+    return VoiceOverResponse(
+        result.get("success", False),
+        **{k: v for k, v in result.items() if k in _RESP_FIELDS}
+    )
+
+def _is_json_reply(content_type: str) -> bool:
+    """Walk replies are NDJSON, or plain JSON for a rejected request"""
+    return content_type.startswith(("application/x-ndjson", "application/json"))
 
 class VoiceOverClient:
-    def __init__(self, base_url: str = "http://localhost:3000"):
+    def __init__(self, base_url: str = "http://localhost:3000", current_cache_ttl: float = 0.1,
+                 timeout: float = DEFAULT_TIMEOUT):
         self.base_url = base_url
+        self.timeout = timeout
+        # Last /voiceover/current reply, reused for current_cache_ttl seconds
+        # unless a POST (which may move focus) happens in between
+        self.current_cache_ttl = current_cache_ttl
+        self._current_cache: Optional[VoiceOverResponse] = None
+        self._current_cache_ts: float = 0.0
+        # Persistent session keeps the TCP connection to the server alive between calls
+        self._session = requests.Session()
+        self._session.mount(base_url, HTTPAdapter(pool_connections=1, pool_maxsize=4))
+        
+    def __enter__(self) -> "VoiceOverClient":
+        self._session.__enter__()
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self._session.__exit__(*exc_info)
+    
+    def close(self) -> None:
+        """Close the underlying HTTP session"""
+        self._session.close()
         
-    def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> VoiceOverResponse:
+    def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None,
+                      timeout: Optional[float] = None) -> VoiceOverResponse:
         """Make HTTP request to VoiceOver server"""
         url = f"{self.base_url}{endpoint}"
+        timeout = timeout if timeout is not None else self.timeout
         
         try:
             if method.upper() == "GET":
-                response = requests.get(url)
+                response = self._session.get(url, timeout=timeout)
             elif method.upper() == "POST":
-                response = requests.post(url, json=data or {})
+                self._current_cache = None
+                response = self._session.post(url, json=data or {}, timeout=timeout)
             else:
                 raise ValueError(f"Unsupported method: {method}")
             
-            result = response.json()
+            result = _loads(response.content)
             
-            return VoiceOverResponse(
-                success=result.get("success", False),
-                message=result.get("message"),
-                currentItem=result.get("currentItem"),
-                responses=result.get("responses"),
-                error=result.get("error")
-            )
+            return _to_response(result)
             
+        except requests.exceptions.Timeout:
+            return VoiceOverResponse(success=False, error="timeout")
         except requests.exceptions.ConnectionError:
             return VoiceOverResponse(
                 success=False,
@@ -51,11 +108,11 @@ class VoiceOverClient:
     
     def start_voiceover(self) -> VoiceOverResponse:
         """Start VoiceOver"""
-        return self._make_request("POST", "/voiceover/start")
+        return self._make_request("POST", "/voiceover/start", timeout=LONG_TIMEOUT)
     
     def stop_voiceover(self) -> VoiceOverResponse:
         """Stop VoiceOver"""
-        return self._make_request("POST", "/voiceover/stop")
+        return self._make_request("POST", "/voiceover/stop", timeout=LONG_TIMEOUT)
     
     def type_text(self, text: str) -> VoiceOverResponse:
         """Type text using VoiceOver"""
@@ -65,34 +122,219 @@ class VoiceOverClient:
         """Navigate to next element"""
         return self._make_request("POST", "/voiceover/next")
     
+    def navigate_next_and_read(self) -> VoiceOverResponse:
+        """
+        Navigate to next element and return the newly focused item in one round trip.
+        
+        The reply also seeds the get_current_item() cache.
+        """
+        result = self._make_request("POST", "/voiceover/next")
+        if result.success and result.currentItem is not None:
+            self._current_cache = result
+            self._current_cache_ts = time.monotonic()
+        return result
+    
     def navigate_previous(self) -> VoiceOverResponse:
         """Navigate to previous element"""
         return self._make_request("POST", "/voiceover/previous")
     
     def get_current_item(self) -> VoiceOverResponse:
         """Get current item being read by VoiceOver"""
-        return self._make_request("GET", "/voiceover/current")
+        cached = self._current_cache
+        if cached is not None and time.monotonic() - self._current_cache_ts < self.current_cache_ttl:
+            return cached
+        
+        result = self._make_request("GET", "/voiceover/current")
+        if result.success:
+            self._current_cache = result
+            self._current_cache_ts = time.monotonic()
+        return result
     
     def click_current(self) -> VoiceOverResponse:
         """Click/activate current item"""
         return self._make_request("POST", "/voiceover/click")
     
+    def walk(self, stop_on: str, limit: int = 20, step_delay_ms: int = 500) -> Iterator[Dict[str, Any]]:
+        """
+        Walk forward on the server, yielding one dict per visited element.
+        
+        Elements look like {"success": True, "item": ..., "matched": ..., "step": ...};
+        the last one is the match, if any. A failure is yielded as
+        {"success": False, "error": ...} and ends the walk.
+        """
+        # The walk moves focus even though it is a GET
+        self._current_cache = None
+        params = {"stop_on": stop_on, "limit": limit, "step_delay_ms": step_delay_ms}
+        # Each line follows a step delay plus the navigation itself
+        read_timeout = self.timeout + step_delay_ms / 1000
+        
+        try:
+            with self._session.get(f"{self.base_url}/voiceover/walk", params=params,
+                                   timeout=(self.timeout, read_timeout), stream=True) as response:
+                if not _is_json_reply(response.headers.get("Content-Type", "")):
+                    yield {"success": False, "error": f"Unexpected reply from server (HTTP {response.status_code})"}
+                    return
+                for line in response.iter_lines():
+                    if line:
+                        yield _loads(line)
+        except requests.exceptions.Timeout:
+            yield {"success": False, "error": "timeout"}
+        except requests.exceptions.ConnectionError as e:
+            # iter_lines() re-raises a mid-stream read timeout as ConnectionError
+            if e.args and isinstance(e.args[0], ReadTimeoutError):
+                yield {"success": False, "error": "timeout"}
+            else:
+                yield {"success": False, "error": "Could not connect to VoiceOver server. Make sure it's running."}
+        except Exception as e:
+            yield {"success": False, "error": str(e)}
+    
     def open_app(self, app_name: str) -> VoiceOverResponse:
         """Open an application"""
         return self._make_request("POST", "/system/open-app", {"appName": app_name})
     
+    def open_any_app(self, candidates: Sequence[str]) -> VoiceOverResponse:
+        """Open the first of several application names that exists (opened/tried report which)"""
+        return self._make_request("POST", "/system/open-app", {"candidates": list(candidates)})
+    
     def press_key(self, key: str) -> VoiceOverResponse:
         """Press a key"""
         return self._make_request("POST", "/system/press-key", {"key": key})
     
     def open_copilot_and_send_message(self, message: str) -> VoiceOverResponse:
         """Complete operation: open Copilot and send a message"""
-        return self._make_request("POST", "/operations/open-copilot-and-send-message", {"message": message})
+        return self._make_request("POST", "/operations/open-copilot-and-send-message", {"message": message},
+                                  timeout=LONG_TIMEOUT)
     
     def health_check(self) -> VoiceOverResponse:
         """Check server health"""
         return self._make_request("GET", "/health")
 
+class AsyncVoiceOverClient:
+    """
+    asyncio variant of VoiceOverClient.
+
+    The aiohttp.ClientSession is owned by the caller so that one connection
+    pool is shared across every request of a run:
+
+        async with aiohttp.ClientSession() as session:
+            client = AsyncVoiceOverClient(session)
+            await client.start_voiceover()
+    """
+    def __init__(self, session: "aiohttp.ClientSession", base_url: str = "http://localhost:3000",
+                 timeout: float = DEFAULT_TIMEOUT):
+        if aiohttp is None:
+            raise ImportError("AsyncVoiceOverClient requires aiohttp: pip3 install aiohttp")
+        self._session = session
+        self.base_url = base_url
+        self.timeout = timeout
+        
+    async def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None,
+                            timeout: Optional[float] = None) -> VoiceOverResponse:
+        """Make HTTP request to VoiceOver server"""
+        url = f"{self.base_url}{endpoint}"
+        client_timeout = aiohttp.ClientTimeout(total=timeout if timeout is not None else self.timeout)
+        
+        try:
+            if method.upper() == "GET":
+                async with self._session.get(url, timeout=client_timeout) as response:
+                    result = _loads(await response.read())
+            elif method.upper() == "POST":
+                async with self._session.post(url, json=data or {}, timeout=client_timeout) as response:
+                    result = _loads(await response.read())
+            else:
+                raise ValueError(f"Unsupported method: {method}")
+            
+            return _to_response(result)
+            
+        except asyncio.TimeoutError:
+            return VoiceOverResponse(success=False, error="timeout")
+        except aiohttp.ClientConnectionError:
+            return VoiceOverResponse(
+                success=False,
+                error="Could not connect to VoiceOver server. Make sure it's running."
+            )
+        except Exception as e:
+            return VoiceOverResponse(
+                success=False,
+                error=str(e)
+            )
+    
+    async def start_voiceover(self) -> VoiceOverResponse:
+        """Start VoiceOver"""
+        return await self._make_request("POST", "/voiceover/start", timeout=LONG_TIMEOUT)
+    
+    async def stop_voiceover(self) -> VoiceOverResponse:
+        """Stop VoiceOver"""
+        return await self._make_request("POST", "/voiceover/stop", timeout=LONG_TIMEOUT)
+    
+    async def type_text(self, text: str) -> VoiceOverResponse:
+        """Type text using VoiceOver"""
+        return await self._make_request("POST", "/voiceover/type", {"text": text})
+    
+    async def navigate_next(self) -> VoiceOverResponse:
+        """Navigate to next element"""
+        return await self._make_request("POST", "/voiceover/next")
+    
+    # /voiceover/next already returns the new currentItem, and this client has
+    # no cache to seed, so the combined form is the same call
+    navigate_next_and_read = navigate_next
+    
+    async def navigate_previous(self) -> VoiceOverResponse:
+        """Navigate to previous element"""
+        return await self._make_request("POST", "/voiceover/previous")
+    
+    async def get_current_item(self) -> VoiceOverResponse:
+        """Get current item being read by VoiceOver"""
+        return await self._make_request("GET", "/voiceover/current")
+    
+    async def click_current(self) -> VoiceOverResponse:
+        """Click/activate current item"""
+        return await self._make_request("POST", "/voiceover/click")
+    
+    async def walk(self, stop_on: str, limit: int = 20, step_delay_ms: int = 500) -> AsyncIterator[Dict[str, Any]]:
+        """Walk forward on the server, yielding one dict per visited element (see VoiceOverClient.walk)"""
+        params = {"stop_on": stop_on, "limit": limit, "step_delay_ms": step_delay_ms}
+        # The stream stays open for the whole walk, so only bound the wait for
+        # each line, which follows a step delay plus the navigation itself
+        client_timeout = aiohttp.ClientTimeout(total=None, sock_read=self.timeout + step_delay_ms / 1000)
+        
+        try:
+            async with self._session.get(f"{self.base_url}/voiceover/walk", params=params,
+                                         timeout=client_timeout) as response:
+                if not _is_json_reply(response.headers.get("Content-Type", "")):
+                    yield {"success": False, "error": f"Unexpected reply from server (HTTP {response.status})"}
+                    return
+                async for line in response.content:
+                    if line.strip():
+                        yield _loads(line)
+        except asyncio.TimeoutError:
+            yield {"success": False, "error": "timeout"}
+        except aiohttp.ClientConnectionError:
+            yield {"success": False, "error": "Could not connect to VoiceOver server. Make sure it's running."}
+        except Exception as e:
+            yield {"success": False, "error": str(e)}
+    
+    async def open_app(self, app_name: str) -> VoiceOverResponse:
+        """Open an application"""
+        return await self._make_request("POST", "/system/open-app", {"appName": app_name})
+    
+    async def open_any_app(self, candidates: Sequence[str]) -> VoiceOverResponse:
+        """Open the first of several application names that exists (opened/tried report which)"""
+        return await self._make_request("POST", "/system/open-app", {"candidates": list(candidates)})
+    
+    async def press_key(self, key: str) -> VoiceOverResponse:
+        """Press a key"""
+        return await self._make_request("POST", "/system/press-key", {"key": key})
+    
+    async def open_copilot_and_send_message(self, message: str) -> VoiceOverResponse:
+        """Complete operation: open Copilot and send a message"""
+        return await self._make_request("POST", "/operations/open-copilot-and-send-message", {"message": message},
+                                        timeout=LONG_TIMEOUT)
+    
+    async def health_check(self) -> VoiceOverResponse:
+        """Check server health"""
+        return await self._make_request("GET", "/health")
+
 # Example usage and LLM integration helper
 class AccessibilityAgent:
     def __init__(self):